@@ -1,9 +1,13 @@
 from flask import Flask, render_template, redirect, url_for, send_from_directory, request, session, g
 from flask_babel import Babel, gettext as _, lazy_gettext as _l
+from flask_caching import Cache
+from jinja2 import FileSystemBytecodeCache
 from sqlalchemy import create_engine, text
 from sqlalchemy.pool import QueuePool
 import os
-import pandas as pd
+import time
+import threading
+from contextlib import nullcontext
 
 app = Flask(__name__)
 app.secret_key = os.environ.get("SECRET_KEY", "voleibol-stats-secret-key-2024")
@@ -13,14 +17,34 @@ app.config['LANGUAGES'] = ['ca', 'es', 'en']
 app.config['BABEL_DEFAULT_LOCALE'] = 'ca'
 app.config['BABEL_TRANSLATION_DIRECTORIES'] = 'translations'
 
+# JSON compacto y sin ordenar claves (ahorra trabajo en cualquier respuesta JSON)
+app.json.sort_keys = False
+app.json.compact = True
+
+# Ficheros estáticos cacheables un día por navegadores, proxies y CDN
+app.config['SEND_FILE_MAX_AGE_DEFAULT'] = 86400
+
+# Plantillas: no comprobar cambios en disco y cachear el bytecode compilado
+app.config['TEMPLATES_AUTO_RELOAD'] = False
+app.jinja_env.auto_reload = False
+app.jinja_env.bytecode_cache = FileSystemBytecodeCache()
+
 babel = Babel()
 
 def get_locale():
-    """Determina el idioma a usar"""
+    """Determina el idioma a usar (se calcula una sola vez por petición)"""
+    if '_locale' not in g:
+        g._locale = _detectar_locale()
+    return g._locale
+
+def _detectar_locale():
+    """Detecta el idioma a partir de la URL, la sesión o el navegador"""
     # 1. Primero comprobar si hay idioma en la URL (?lang=es)
     lang = request.args.get('lang')
     if lang and lang in app.config['LANGUAGES']:
-        session['lang'] = lang
+        # Solo tocar la sesión si cambia, para no reemitir la cookie
+        if session.get('lang') != lang:
+            session['lang'] = lang
         return lang
     
     # 2. Comprobar si hay idioma guardado en sesión
@@ -32,6 +56,17 @@ def get_locale():
 
 babel.init_app(app, locale_selector=get_locale)
 
+# Caché de páginas renderizadas (en memoria del proceso)
+cache = Cache(app, config={'CACHE_TYPE': 'SimpleCache', 'CACHE_DEFAULT_TIMEOUT': 60})
+
+def cache_key_idioma():
+    """Clave de caché por ruta e idioma, ya que las páginas se traducen"""
+    return f"view/{request.path}/{get_locale()}"
+
+def es_pagina_renderizada(rv):
+    """Solo se cachean páginas renderizadas, no redirecciones"""
+    return getattr(rv, 'status_code', 200) == 200
+
 # Diccionario de traducciones para valores de base de datos
 TRADUCCIONES_POSICIONES = {
     'ca': {
@@ -66,6 +101,11 @@ def traducir_posicion(posicion):
     traducciones = TRADUCCIONES_POSICIONES.get(lang, TRADUCCIONES_POSICIONES['ca'])
     return traducciones.get(posicion, posicion)
 
+@app.template_filter('ddmmyyyy')
+def ddmmyyyy(fecha):
+    """Filtro para mostrar fechas como DD/MM/YYYY"""
+    return fecha.strftime('%d/%m/%Y') if fecha else ''
+
 @app.context_processor
 def inject_locale():
     """Inyecta el idioma actual en todos los templates"""
@@ -81,9 +121,21 @@ def inject_locale():
 
 # Configuración de base de datos (usa la misma que Streamlit)
 DATABASE_URL = os.environ.get("DATABASE_URL")
-
-# Variable global para reusar el engine
+# Pool por worker. Conexiones máximas por dyno:
+#   WEB_CONCURRENCY x (DB_POOL_SIZE + DB_MAX_OVERFLOW) = 2 x (2 + 3) = 10
+# La base de datos se comparte con Streamlit y los planes pequeños limitan
+# el total a ~20 conexiones: subir estos valores solo si el plan lo permite.
+DB_POOL_SIZE = int(os.environ.get("DB_POOL_SIZE", 2))
+DB_MAX_OVERFLOW = int(os.environ.get("DB_MAX_OVERFLOW", 3))
+DB_POOL_RECYCLE = int(os.environ.get("DB_POOL_RECYCLE", 300))
+# Ejecuciones tras las que psycopg prepara la sentencia en el servidor.
+# Vacío la desactiva (necesario detrás de PgBouncer en modo transaction).
+_prepare_threshold = os.environ.get("DB_PREPARE_THRESHOLD", "1")
+DB_PREPARE_THRESHOLD = int(_prepare_threshold) if _prepare_threshold else None
+
+# Variable global para reusar el engine (un único pool por proceso)
 _engine = None
+_engine_lock = threading.Lock()
 
 def get_engine():
     """Obtiene conexión a la base de datos con pool limitado"""
@@ -92,242 +144,294 @@ def get_engine():
     if _engine is not None:
         return _engine
     
-    if DATABASE_URL:
-        url = DATABASE_URL.replace("postgres://", "postgresql://")
-        _engine = create_engine(
-            url,
-            poolclass=QueuePool,
-            pool_size=2,
-            max_overflow=3,
-            pool_pre_ping=True,
-            pool_recycle=300
-        )
-        return _engine
-    return None
-
-def get_equipos():
-    """Obtiene lista de equipos"""
+    if not DATABASE_URL:
+        return None
+    
+    with _engine_lock:
+        # Otro hilo puede haberlo creado mientras esperábamos el lock
+        if _engine is None:
+            # Usar psycopg 3 (sentencias preparadas automáticas en el servidor)
+            url = DATABASE_URL.replace("postgres://", "postgresql://", 1)
+            url = url.replace("postgresql://", "postgresql+psycopg://", 1)
+            _engine = create_engine(
+                url,
+                poolclass=QueuePool,
+                pool_size=DB_POOL_SIZE,
+                max_overflow=DB_MAX_OVERFLOW,
+                # LIFO: reutilizar la conexión más reciente (caliente) y dejar
+                # que las sobrantes caduquen con pool_recycle en horas valle
+                pool_use_lifo=True,
+                pool_pre_ping=True,
+                pool_recycle=DB_POOL_RECYCLE,
+                query_cache_size=1200,
+                connect_args={"prepare_threshold": DB_PREPARE_THRESHOLD}
+            )
+    return _engine
+
+# ========== CONSULTAS SQL ==========
+# Definidas a nivel de módulo para que SQLAlchemy reutilice la compilación
+
+_SQL_EQUIPOS = text("""
+    SELECT id, nombre, equipo_letra,
+           CASE 
+               WHEN equipo_letra IS NOT NULL AND equipo_letra != ''
+               THEN nombre || ' ' || equipo_letra
+               ELSE nombre
+           END as nombre_completo
+    FROM equipos
+    ORDER BY nombre, equipo_letra
+""")
+
+# Estadísticas y racha (últimos 5 partidos) en una sola consulta.
+# La diferencia de sets se calcula una vez por partido (positiva = victoria).
+_SQL_EQUIPO_STATS = text("""
+    WITH partidos AS (
+        SELECT 
+            id,
+            fecha,
+            resultado,
+            CASE 
+                WHEN local = true THEN SPLIT_PART(resultado, '-', 1)::int - SPLIT_PART(resultado, '-', 2)::int
+                WHEN local = false THEN SPLIT_PART(resultado, '-', 2)::int - SPLIT_PART(resultado, '-', 1)::int
+            END as diferencia
+        FROM partidos_new
+        WHERE equipo_id = :equipo_id
+    ),
+    ultimos AS (
+        SELECT 
+            fecha,
+            id,
+            CASE WHEN diferencia > 0 THEN 'W' ELSE 'L' END as wl
+        FROM partidos
+        WHERE resultado IS NOT NULL
+        ORDER BY fecha DESC, id DESC
+        LIMIT 5
+    )
+    SELECT 
+        COUNT(*) as partidos,
+        COUNT(*) FILTER (WHERE diferencia > 0) as victorias,
+        COUNT(*) FILTER (WHERE diferencia < 0) as derrotas,
+        (
+            SELECT COALESCE(array_agg(wl ORDER BY fecha DESC, id DESC), '{}'::text[])
+            FROM ultimos
+        ) as racha
+    FROM partidos
+""")
+
+_SQL_JUGADORES_EQUIPO = text("""
+    SELECT apellido, posicion, dorsal
+    FROM jugadores
+    WHERE equipo_id = :equipo_id AND activo = true
+    ORDER BY dorsal NULLS LAST, apellido
+""")
+
+# Solo se agregan las acciones que son punto (marca '#'), así el join
+# trabaja sobre muchas menos filas y puede usar el índice parcial
+_SQL_TOP_ANOTADORES = text("""
+    SELECT 
+        j.apellido as jugador,
+        COUNT(*) as puntos
+    FROM acciones_new a
+    JOIN jugadores j ON a.jugador_id = j.id
+    JOIN partidos_new p ON a.partido_id = p.id
+    WHERE p.equipo_id = :equipo_id
+    AND a.tipo_accion IN ('atacar', 'bloqueo', 'saque')
+    AND a.marca = '#'
+    GROUP BY j.id, j.apellido
+    ORDER BY puntos DESC
+    LIMIT :limit
+""")
+
+_SQL_PARTIDOS_EQUIPO = text("""
+    SELECT 
+        id,
+        rival,
+        local,
+        resultado,
+        fecha,
+        CASE 
+            WHEN (local = true AND SPLIT_PART(resultado, '-', 1)::int > SPLIT_PART(resultado, '-', 2)::int)
+                 OR (local = false AND SPLIT_PART(resultado, '-', 2)::int > SPLIT_PART(resultado, '-', 1)::int)
+            THEN 'victoria'
+            ELSE 'derrota'
+        END as resultado_tipo
+    FROM partidos_new
+    WHERE equipo_id = :equipo_id
+    ORDER BY fecha DESC, id DESC
+    LIMIT :limit
+""")
+
+_SQL_TODOS_RESULTADOS = text("""
+    SELECT 
+        p.id,
+        CASE 
+            WHEN e.equipo_letra IS NOT NULL AND e.equipo_letra != ''
+            THEN e.nombre || ' ' || e.equipo_letra
+            ELSE e.nombre
+        END as equipo,
+        p.rival,
+        p.resultado,
+        p.local,
+        p.fecha,
+        CASE 
+            WHEN (local = true AND SPLIT_PART(resultado, '-', 1)::int > SPLIT_PART(resultado, '-', 2)::int)
+                OR (local = false AND SPLIT_PART(resultado, '-', 2)::int > SPLIT_PART(resultado, '-', 1)::int)
+            THEN 'victoria'
+            ELSE 'derrota'
+        END as resultado_tipo
+    FROM partidos_new p
+    JOIN equipos e ON p.equipo_id = e.id
+    WHERE p.resultado IS NOT NULL
+    ORDER BY p.fecha DESC
+    LIMIT :limit
+""")
+
+def _conexion(engine, conn=None):
+    """Reutiliza la conexión recibida o abre una nueva del pool"""
+    if conn is not None:
+        return nullcontext(conn)
+    return engine.connect()
+
+# Caché en memoria de la lista de equipos (cambia muy poco)
+EQUIPOS_CACHE_TTL = 60
+_equipos_cache = {"ts": 0, "data": None, "by_id": {}}
+
+def get_equipos(conn=None):
+    """Obtiene lista de equipos (cacheada durante EQUIPOS_CACHE_TTL segundos)"""
+    now = time.monotonic()
+    if _equipos_cache["data"] is not None and now - _equipos_cache["ts"] < EQUIPOS_CACHE_TTL:
+        return _equipos_cache["data"]
+    
     engine = get_engine()
     if not engine:
         return []
     
-    with engine.connect() as conn:
-        df = pd.read_sql(text("""
-            SELECT id, nombre, equipo_letra,
-                   CASE 
-                       WHEN equipo_letra IS NOT NULL AND equipo_letra != ''
-                       THEN nombre || ' ' || equipo_letra
-                       ELSE nombre
-                   END as nombre_completo
-            FROM equipos
-            ORDER BY nombre, equipo_letra
-        """), conn)
-        return df.to_dict('records')
-
-def get_equipo_stats(equipo_id):
+    with _conexion(engine, conn) as conn:
+        result = conn.execute(_SQL_EQUIPOS)
+        data = [dict(row) for row in result.mappings()]
+    
+    _equipos_cache["by_id"] = {e['id']: e for e in data}
+    _equipos_cache["data"] = data
+    _equipos_cache["ts"] = now
+    return data
+
+def get_equipo_info(equipo_id):
+    """Obtiene un equipo por id a partir de la lista cacheada"""
+    get_equipos()
+    return _equipos_cache["by_id"].get(equipo_id)
+
+def get_equipo_stats(equipo_id, conn=None):
     """Obtiene estadísticas de un equipo"""
     engine = get_engine()
     if not engine:
         return None
     
-    with engine.connect() as conn:
-        stats = pd.read_sql(text("""
-            SELECT 
-                COUNT(*) as partidos,
-                COUNT(*) FILTER (WHERE 
-                    (local = true AND SPLIT_PART(resultado, '-', 1)::int > SPLIT_PART(resultado, '-', 2)::int)
-                    OR 
-                    (local = false AND SPLIT_PART(resultado, '-', 2)::int > SPLIT_PART(resultado, '-', 1)::int)
-                ) as victorias,
-                COUNT(*) FILTER (WHERE 
-                    (local = true AND SPLIT_PART(resultado, '-', 1)::int < SPLIT_PART(resultado, '-', 2)::int)
-                    OR 
-                    (local = false AND SPLIT_PART(resultado, '-', 2)::int < SPLIT_PART(resultado, '-', 1)::int)
-                ) as derrotas
-            FROM partidos_new
-            WHERE equipo_id = :equipo_id
-        """), conn, params={"equipo_id": equipo_id})
+    with _conexion(engine, conn) as conn:
+        stats = conn.execute(_SQL_EQUIPO_STATS, {"equipo_id": equipo_id}).mappings().first()
         
-        if stats.empty:
+        if stats is None:
             return None
         
-        result = stats.iloc[0].to_dict()
-        
-        # Calcular racha actual (últimos 5 partidos)
-        ultimos = pd.read_sql(text("""
-            SELECT resultado, local
-            FROM partidos_new
-            WHERE equipo_id = :equipo_id AND resultado IS NOT NULL
-            ORDER BY fecha DESC, id DESC
-            LIMIT 5
-        """), conn, params={"equipo_id": equipo_id})
-        
-        if not ultimos.empty:
-            racha = []
-            for _, row in ultimos.iterrows():
-                try:
-                    partes = row['resultado'].split('-')
-                    sets_local = int(partes[0])
-                    sets_visitante = int(partes[1])
-                    
-                    if row['local']:
-                        # Si somos locales, ganamos si el primer número es mayor
-                        victoria = sets_local > sets_visitante
-                    else:
-                        # Si somos visitantes, ganamos si el segundo número es mayor
-                        victoria = sets_visitante > sets_local
-                    
-                    racha.append('W' if victoria else 'L')
-                except:
-                    racha.append('?')
-            result['racha'] = racha
-        else:
-            result['racha'] = []
-        
-        return result
+        return dict(stats)
 
-def get_jugadores_equipo(equipo_id):
+def get_jugadores_equipo(equipo_id, conn=None):
     """Obtiene jugadores de un equipo"""
     engine = get_engine()
     if not engine:
         return []
     
-    with engine.connect() as conn:
-        df = pd.read_sql(text("""
-            SELECT apellido, posicion, dorsal
-            FROM jugadores
-            WHERE equipo_id = :equipo_id AND activo = true
-            ORDER BY dorsal NULLS LAST, apellido
-        """), conn, params={"equipo_id": equipo_id})
-        return df.to_dict('records')
-
-def get_top_anotadores(equipo_id, limit=5):
+    with _conexion(engine, conn) as conn:
+        result = conn.execute(_SQL_JUGADORES_EQUIPO, {"equipo_id": equipo_id})
+        return [dict(row) for row in result.mappings()]
+
+def get_top_anotadores(equipo_id, limit=5, conn=None):
     """Obtiene top anotadores del equipo"""
     engine = get_engine()
     if not engine:
         return []
     
-    with engine.connect() as conn:
-        df = pd.read_sql(text("""
-            SELECT 
-                j.apellido as jugador,
-                COUNT(*) FILTER (WHERE a.marca = '#') as puntos
-            FROM acciones_new a
-            JOIN jugadores j ON a.jugador_id = j.id
-            JOIN partidos_new p ON a.partido_id = p.id
-            WHERE p.equipo_id = :equipo_id
-            AND a.tipo_accion IN ('atacar', 'bloqueo', 'saque')
-            GROUP BY j.id, j.apellido
-            HAVING COUNT(*) FILTER (WHERE a.marca = '#') > 0
-            ORDER BY puntos DESC
-            LIMIT :limit
-        """), conn, params={"equipo_id": equipo_id, "limit": limit})
-        return df.to_dict('records')
-
-def get_partidos_equipo(equipo_id, limit=10):
+    with _conexion(engine, conn) as conn:
+        result = conn.execute(_SQL_TOP_ANOTADORES, {"equipo_id": equipo_id, "limit": limit})
+        return [dict(row) for row in result.mappings()]
+
+def get_partidos_equipo(equipo_id, limit=10, conn=None):
     """Obtiene partidos de un equipo (últimos 10 por defecto)"""
     engine = get_engine()
     if not engine:
         return []
     
-    with engine.connect() as conn:
-        limit_clause = f"LIMIT {limit}" if limit else ""
-        
-        df = pd.read_sql(text(f"""
-            SELECT 
-                id,
-                rival,
-                local,
-                resultado,
-                TO_CHAR(fecha, 'DD/MM/YYYY') as fecha_display,
-                fecha as fecha_orden,
-                CASE 
-                    WHEN (local = true AND SPLIT_PART(resultado, '-', 1)::int > SPLIT_PART(resultado, '-', 2)::int)
-                         OR (local = false AND SPLIT_PART(resultado, '-', 2)::int > SPLIT_PART(resultado, '-', 1)::int)
-                    THEN 'victoria'
-                    ELSE 'derrota'
-                END as resultado_tipo
-            FROM partidos_new
-            WHERE equipo_id = :equipo_id
-            ORDER BY fecha_orden DESC, id DESC
-            {limit_clause}
-        """), conn, params={"equipo_id": equipo_id})
-        
-        # Renombrar para mantener compatibilidad con el template
-        df = df.rename(columns={'fecha_display': 'fecha'})
-        df = df.drop(columns=['fecha_orden'])
-        
-        return df.to_dict('records')
-
-def get_todos_resultados():
-    """Obtiene todos los resultados de todos los equipos"""
+    with _conexion(engine, conn) as conn:
+        # Sin límite = todos los partidos (LIMIT NULL en PostgreSQL)
+        result = conn.execute(_SQL_PARTIDOS_EQUIPO, {"equipo_id": equipo_id, "limit": limit or None})
+        return [dict(row) for row in result.mappings()]
+
+# Caché en memoria de los últimos resultados, por límite de filas
+RESULTADOS_CACHE_TTL = 30
+_resultados_cache = {}
+
+def get_todos_resultados(limit=50, conn=None):
+    """Obtiene los últimos resultados de todos los equipos (50 por defecto, cacheados)"""
+    now = time.monotonic()
+    cached = _resultados_cache.get(limit)
+    if cached is not None and now - cached["ts"] < RESULTADOS_CACHE_TTL:
+        return cached["data"]
+    
     engine = get_engine()
     if not engine:
         return []
     
+    with _conexion(engine, conn) as conn:
+        result = conn.execute(_SQL_TODOS_RESULTADOS, {"limit": limit})
+        data = [dict(row) for row in result.mappings()]
+    
+    _resultados_cache[limit] = {"ts": now, "data": data}
+    return data
+
+def get_equipo_page_data(equipo_id):
+    """Obtiene todos los datos de la página de un equipo con una sola conexión"""
+    engine = get_engine()
+    if not engine:
+        return {'stats': None, 'jugadores': [], 'top_anotadores': [], 'partidos': []}
+    
     with engine.connect() as conn:
-        df = pd.read_sql(text("""
-            SELECT 
-                p.id,
-                CASE 
-                    WHEN e.equipo_letra IS NOT NULL AND e.equipo_letra != ''
-                    THEN e.nombre || ' ' || e.equipo_letra
-                    ELSE e.nombre
-                END as equipo,
-                p.rival,
-                p.resultado,
-                p.local,
-                TO_CHAR(p.fecha, 'DD/MM/YYYY') as fecha,
-                CASE 
-                    WHEN (local = true AND SPLIT_PART(resultado, '-', 1)::int > SPLIT_PART(resultado, '-', 2)::int)
-                        OR (local = false AND SPLIT_PART(resultado, '-', 2)::int > SPLIT_PART(resultado, '-', 1)::int)
-                    THEN 'victoria'
-                    ELSE 'derrota'
-                END as resultado_tipo
-            FROM partidos_new p
-            JOIN equipos e ON p.equipo_id = e.id
-            WHERE p.resultado IS NOT NULL
-            ORDER BY p.fecha DESC
-            LIMIT 50
-        """), conn)
-        return df.to_dict('records')
+        return {
+            'stats': get_equipo_stats(equipo_id, conn=conn),
+            'jugadores': get_jugadores_equipo(equipo_id, conn=conn),
+            'top_anotadores': get_top_anotadores(equipo_id, conn=conn),
+            'partidos': get_partidos_equipo(equipo_id, conn=conn)
+        }
 
 
 # ========== RUTAS ==========
 
 @app.route('/')
+@cache.cached(timeout=60, key_prefix=cache_key_idioma)
 def index():
     """Página principal"""
     equipos = get_equipos()
-    ultimos_resultados = get_todos_resultados()[:10]
+    ultimos_resultados = get_todos_resultados(limit=10)
     return render_template('index.html', 
                           equipos=equipos, 
                           ultimos_resultados=ultimos_resultados)
 
 @app.route('/equip/<int:equipo_id>')
+@cache.cached(timeout=30, key_prefix=cache_key_idioma, response_filter=es_pagina_renderizada)
 def equipo(equipo_id):
     """Página de un equipo"""
-    equipos = get_equipos()
-    
-    # Buscar el equipo seleccionado
-    equipo_info = next((e for e in equipos if e['id'] == equipo_id), None)
+    equipo_info = get_equipo_info(equipo_id)
     if not equipo_info:
         return redirect(url_for('index'))
     
-    stats = get_equipo_stats(equipo_id)
-    jugadores = get_jugadores_equipo(equipo_id)
-    top_anotadores = get_top_anotadores(equipo_id)
-    partidos = get_partidos_equipo(equipo_id)
+    equipos = get_equipos()
+    datos = get_equipo_page_data(equipo_id)
     
     return render_template('equipo.html', 
                           equipo=equipo_info,
                           equipos=equipos,
-                          stats=stats,
-                          jugadores=jugadores,
-                          top_anotadores=top_anotadores,
-                          partidos=partidos)
+                          **datos)
 
 @app.route('/resultats')
+@cache.cached(timeout=60, key_prefix=cache_key_idioma)
 def resultados():
     """Página de todos los resultados"""
     equipos = get_equipos()
@@ -344,35 +448,41 @@ def login():
 
 @app.route('/ads.txt')
 def ads_txt():
-    """Servir ads.txt para Google AdSense"""
+    """Servir ads.txt para Google AdSense (cacheable un día por proxies y CDN)"""
     return send_from_directory('static', 'ads.txt')
 
 @app.route('/quisom')
+@cache.cached(timeout=3600, key_prefix=cache_key_idioma)
 def quisom():
     """Página Qui Som"""
     return render_template('quisom.html')
 
 @app.route('/contacte')
+@cache.cached(timeout=3600, key_prefix=cache_key_idioma)
 def contacte():
     """Página de contacto"""
     return render_template('contacte.html')
 
 @app.route('/privacitat')
+@cache.cached(timeout=3600, key_prefix=cache_key_idioma)
 def privacitat():
     """Política de privacitat"""
     return render_template('privacitat.html')
 
 @app.route('/avis-legal')
+@cache.cached(timeout=3600, key_prefix=cache_key_idioma)
 def avis_legal():
     """Avís Legal"""
     return render_template('avis-legal.html')
 
 @app.route('/cookies')
+@cache.cached(timeout=3600, key_prefix=cache_key_idioma)
 def cookies():
     """Política de Cookies"""
     return render_template('cookies.html')
 
 @app.route('/com-funciona')
+@cache.cached(timeout=3600, key_prefix=cache_key_idioma)
 def com_funciona():
     """Com Funciona"""
     return render_template('com-funciona.html')
@@ -386,6 +496,7 @@ def set_language(lang):
     return redirect(request.referrer or url_for('index'))
 
 
+# Solo para desarrollo local; en producción se usa gunicorn (gunicorn.conf.py)
 if __name__ == '__main__':
     port = int(os.environ.get("PORT", 5000))
     app.run(host='0.0.0.0', port=port, debug=False)
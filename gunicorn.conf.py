@@ -0,0 +1,17 @@
+# Configuración de gunicorn para producción (Procfile: gunicorn app:app)
+import os
+
+# Workers por dyno (Heroku define WEB_CONCURRENCY según el tamaño).
+# Cada worker tiene su propio pool de Postgres: el dyno puede abrir hasta
+# WEB_CONCURRENCY x (DB_POOL_SIZE + DB_MAX_OVERFLOW) conexiones (10 por defecto).
+workers = int(os.environ.get("WEB_CONCURRENCY", 2))
+
+# gevent: cada worker atiende muchas peticiones mientras esperan a Postgres
+worker_class = "gevent"
+worker_connections = 500
+timeout = 30
+
+# Sin preload_app: con gevent la app debe importarse después del
+# monkey-patching que hace cada worker. El engine de SQLAlchemy ya se crea
+# de forma perezosa (get_engine), así que nunca se comparte entre procesos.
+preload_app = False
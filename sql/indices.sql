@@ -0,0 +1,28 @@
+-- Índices para las consultas de la web pública (app.py)
+--
+-- Aplicar una vez sobre la base de datos compartida con Streamlit:
+--   psql "$DATABASE_URL" -f sql/indices.sql
+--
+-- CONCURRENTLY no bloquea escrituras; no puede ejecutarse dentro de una
+-- transacción, así que no usar psql --single-transaction.
+
+-- Estadísticas, racha y últimos partidos de un equipo
+-- (WHERE equipo_id = :equipo_id ORDER BY fecha DESC, id DESC)
+CREATE INDEX CONCURRENTLY IF NOT EXISTS partidos_new_equipo_fecha_idx
+    ON partidos_new (equipo_id, fecha DESC, id DESC)
+    INCLUDE (resultado, local, rival);
+
+-- Últimos resultados de todos los equipos (portada y /resultats)
+CREATE INDEX CONCURRENTLY IF NOT EXISTS partidos_new_fecha_con_resultado_idx
+    ON partidos_new (fecha DESC)
+    WHERE resultado IS NOT NULL;
+
+-- Plantilla activa de un equipo
+CREATE INDEX CONCURRENTLY IF NOT EXISTS jugadores_equipo_activos_idx
+    ON jugadores (equipo_id, dorsal NULLS LAST, apellido)
+    WHERE activo = true;
+
+-- Top anotadores: solo acciones que son punto
+CREATE INDEX CONCURRENTLY IF NOT EXISTS acciones_new_puntos_idx
+    ON acciones_new (partido_id, jugador_id)
+    WHERE marca = '#' AND tipo_accion IN ('atacar', 'bloqueo', 'saque');